@@ -0,0 +1,59 @@
+"""
+Shared fixtures for the test suite.
+
+Configuration files that several tests inspect are parsed once per
+session here rather than re-read by every test, and the required project
+layout is checked once before collection.
+"""
+
+import os
+import sys
+
+import pytest
+
+_PROJECT_ROOT_STR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+# tomllib is Python 3.11+; resolved once here instead of in each caller
+if sys.version_info >= (3, 11):
+    import tomllib as _tomllib
+else:
+    _tomllib = None
+
+# (path relative to project root, expected kind)
+_REQUIRED_PATHS = [
+    ("README.md", "file"),
+    (".agent-context", "dir"),
+    ("docs", "dir"),
+    ("pyproject.toml", "file"),
+    (".pre-commit-config.yaml", "file"),
+    (".gitignore", "file"),
+]
+
+
+def pytest_sessionstart(session):
+    """Abort the session before collection if the project structure is broken."""
+    for relpath, kind in _REQUIRED_PATHS:
+        path = os.path.join(_PROJECT_ROOT_STR, relpath)
+        exists = os.path.isdir(path) if kind == "dir" else os.path.isfile(path)
+        if not exists:
+            pytest.exit(f"Project structure broken: {relpath} not found", returncode=2)
+
+
+@pytest.fixture(scope="session")
+def yaml_loader():
+    """Fastest available PyYAML safe loader class (CSafeLoader if built)."""
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    return Loader
+
+
+@pytest.fixture(scope="session")
+def pyproject_config():
+    """Parsed pyproject.toml, or None where tomllib is unavailable (< 3.11)."""
+    if _tomllib is None:
+        return None
+
+    with open(os.path.join(_PROJECT_ROOT_STR, "pyproject.toml"), "rb") as f:
+        return _tomllib.load(f)